@@ -1,7 +1,16 @@
 import ssl
 import sys
 from types import TracebackType
-from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Type
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    cast,
+)
 
 from .._backends.auto import AutoBackend
 from .._backends.base import SOCKET_OPTION, AsyncNetworkBackend
@@ -116,8 +125,11 @@ class AsyncConnectionPool(AsyncRequestInterface):
 
         # The mutable state on a connection pool is the queue of incoming requests,
         # and the set of connections that are servicing those requests.
+        #
+        # The request queue is an insertion-ordered dict, used as an ordered set,
+        # so that requests can be removed in O(1) rather than by a list scan.
         self._connections: List[AsyncConnectionInterface] = []
-        self._requests: List[AsyncPoolRequest] = []
+        self._requests: Dict[AsyncPoolRequest, None] = {}
 
         # We only mutate the state of the connection pool within an 'optional_thread_lock'
         # context. This holds a threading lock unless we're running in async mode,
@@ -178,7 +190,7 @@ class AsyncConnectionPool(AsyncRequestInterface):
         with self._optional_thread_lock:
             # Add the incoming request to our request queue.
             pool_request = AsyncPoolRequest(request)
-            self._requests.append(pool_request)
+            self._requests[pool_request] = None
 
         try:
             while True:
@@ -209,7 +221,7 @@ class AsyncConnectionPool(AsyncRequestInterface):
             with self._optional_thread_lock:
                 # For any exception or cancellation we remove the request from
                 # the queue, and then re-assign requests to connections.
-                self._requests.remove(pool_request)
+                del self._requests[pool_request]
                 closing = self._assign_requests_to_connections()
 
             await self._close_connections(closing)
@@ -217,13 +229,12 @@ class AsyncConnectionPool(AsyncRequestInterface):
 
         # Return the response. Note that in this case we still have to manage
         # the point at which the response is closed.
-        assert isinstance(response.stream, AsyncIterable)
+        # Connections always return a stream of the matching sync/async kind.
+        stream = cast(AsyncIterable[bytes], response.stream)
         return Response(
             status=response.status,
             headers=response.headers,
-            content=PoolByteStream(
-                stream=response.stream, pool_request=pool_request, pool=self
-            ),
+            content=PoolByteStream(stream=stream, pool_request=pool_request, pool=self),
             extensions=response.extensions,
         )
 
@@ -300,6 +311,11 @@ class AsyncConnectionPool(AsyncRequestInterface):
 
     async def _close_connections(self, closing: List[AsyncConnectionInterface]) -> None:
         # Close connections which have been removed from the pool.
+        # Most of the time there is nothing to close, in which case we can
+        # avoid setting up a cancellation shield entirely.
+        if not closing:
+            return
+
         with AsyncShieldCancellation():
             for connection in closing:
                 await connection.aclose()
@@ -374,7 +390,7 @@ class PoolByteStream:
                     await self._stream.aclose()
 
             with self._pool._optional_thread_lock:
-                self._pool._requests.remove(self._pool_request)
+                del self._pool._requests[self._pool_request]
                 closing = self._pool._assign_requests_to_connections()
 
             await self._pool._close_connections(closing)
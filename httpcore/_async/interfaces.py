@@ -1,5 +1,5 @@
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Optional, Union
+from types import TracebackType
+from typing import AsyncIterator, Optional, Type, Union
 
 from .._models import (
     URL,
@@ -8,14 +8,13 @@ from .._models import (
     Origin,
     Request,
     Response,
-    enforce_bytes,
-    enforce_headers,
-    enforce_url,
     include_request_headers,
 )
 
 
 class AsyncRequestInterface:
+    __slots__ = ()
+
     async def request(
         self,
         method: Union[bytes, str],
@@ -25,14 +24,7 @@ class AsyncRequestInterface:
         content: Union[bytes, AsyncIterator[bytes], None] = None,
         extensions: Optional[Extensions] = None,
     ) -> Response:
-        # Strict type checking on our parameters.
-        method = enforce_bytes(method, name="method")
-        url = enforce_url(url, name="url")
-        headers = enforce_headers(headers, name="headers")
-
-        # Include Host header, and optionally Content-Length or Transfer-Encoding.
-        headers = include_request_headers(headers, url=url, content=content)
-
+        # Strict type checking on our parameters is performed by `Request`.
         request = Request(
             method=method,
             url=url,
@@ -40,6 +32,11 @@ class AsyncRequestInterface:
             content=content,
             extensions=extensions,
         )
+
+        # Include Host header, and optionally Content-Length or Transfer-Encoding.
+        request.headers = include_request_headers(
+            request.headers, url=request.url, content=content
+        )
         response = await self.handle_async_request(request)
         try:
             await response.aread()
@@ -47,8 +44,7 @@ class AsyncRequestInterface:
             await response.aclose()
         return response
 
-    @asynccontextmanager
-    async def stream(
+    def stream(
         self,
         method: Union[bytes, str],
         url: Union[URL, bytes, str],
@@ -56,15 +52,8 @@ class AsyncRequestInterface:
         headers: HeaderTypes = None,
         content: Union[bytes, AsyncIterator[bytes], None] = None,
         extensions: Optional[Extensions] = None,
-    ) -> AsyncIterator[Response]:
-        # Strict type checking on our parameters.
-        method = enforce_bytes(method, name="method")
-        url = enforce_url(url, name="url")
-        headers = enforce_headers(headers, name="headers")
-
-        # Include Host header, and optionally Content-Length or Transfer-Encoding.
-        headers = include_request_headers(headers, url=url, content=content)
-
+    ) -> "AsyncStreamContextManager":
+        # Strict type checking on our parameters is performed by `Request`.
         request = Request(
             method=method,
             url=url,
@@ -72,17 +61,50 @@ class AsyncRequestInterface:
             content=content,
             extensions=extensions,
         )
-        response = await self.handle_async_request(request)
-        try:
-            yield response
-        finally:
-            await response.aclose()
+
+        # Include Host header, and optionally Content-Length or Transfer-Encoding.
+        request.headers = include_request_headers(
+            request.headers, url=request.url, content=content
+        )
+        return AsyncStreamContextManager(self, request)
 
     async def handle_async_request(self, request: Request) -> Response:
         raise NotImplementedError()  # pragma: nocover
 
 
+class AsyncStreamContextManager:
+    """
+    The context manager returned by `.stream()`.
+
+    Sends the request on entering the block, and closes the response on
+    leaving it. We use a plain class rather than a generator-based context
+    manager here, since this is on the hot path for every streaming request.
+    """
+
+    __slots__ = ("_interface", "_request", "_response")
+
+    def __init__(self, interface: AsyncRequestInterface, request: Request) -> None:
+        self._interface = interface
+        self._request = request
+        self._response: Optional[Response] = None
+
+    async def __aenter__(self) -> Response:
+        self._response = await self._interface.handle_async_request(self._request)
+        return self._response
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        assert self._response is not None
+        await self._response.aclose()
+
+
 class AsyncConnectionInterface(AsyncRequestInterface):
+    __slots__ = ()
+
     async def aclose(self) -> None:
         raise NotImplementedError()  # pragma: nocover
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import (
     Any,
     AsyncIterable,
@@ -111,6 +112,17 @@ DEFAULT_PORTS = {
     b"wss": 443,
 }
 
+# The schemes for which we can determine an origin, and their default ports.
+# Looked up by `URL.origin`, which the connection pool calls when dispatching
+# every request, so we define this once rather than on each call.
+ORIGIN_DEFAULT_PORTS = {
+    b"http": 80,
+    b"https": 443,
+    b"ws": 80,
+    b"wss": 443,
+    b"socks5": 1080,
+}
+
 
 def include_request_headers(
     headers: List[Tuple[bytes, bytes]],
@@ -185,6 +197,29 @@ class Origin:
         return f"{scheme}://{host}:{port}"
 
 
+def parse_url(url: bytes) -> Tuple[bytes, bytes, Optional[int], bytes]:
+    """
+    Parse a complete URL into its (scheme, host, port, target) components.
+
+    Clients commonly send many requests to an identical URL, so we cache the
+    results. URLs that include a userinfo, query string or fragment component
+    bypass the cache, since those are the usual places for credentials and
+    tokens. Secrets embedded in the path itself will still be cached.
+    """
+    if b"@" in url or b"?" in url or b"#" in url:
+        return _parse_url(url)
+    return _cached_parse_url(url)
+
+
+def _parse_url(url: bytes) -> Tuple[bytes, bytes, Optional[int], bytes]:
+    parsed = urlparse(url)
+    target = (parsed.path or b"/") + (b"?" + parsed.query if parsed.query else b"")
+    return (parsed.scheme, parsed.hostname or b"", parsed.port, target)
+
+
+_cached_parse_url = lru_cache(maxsize=256)(_parse_url)
+
+
 class URL:
     """
     Represents the URL against which an HTTP request may be made.
@@ -271,12 +306,8 @@ class URL:
             target: The target of the HTTP request. Such as `"/items?search=red"`.
         """
         if url:
-            parsed = urlparse(enforce_bytes(url, name="url"))
-            self.scheme = parsed.scheme
-            self.host = parsed.hostname or b""
-            self.port = parsed.port
-            self.target = (parsed.path or b"/") + (
-                b"?" + parsed.query if parsed.query else b""
+            self.scheme, self.host, self.port, self.target = parse_url(
+                enforce_bytes(url, name="url")
             )
         else:
             self.scheme = enforce_bytes(scheme, name="scheme")
@@ -286,13 +317,7 @@ class URL:
 
     @property
     def origin(self) -> Origin:
-        default_port = {
-            b"http": 80,
-            b"https": 443,
-            b"ws": 80,
-            b"wss": 443,
-            b"socks5": 1080,
-        }[self.scheme]
+        default_port = ORIGIN_DEFAULT_PORTS[self.scheme]
         return Origin(
             scheme=self.scheme, host=self.host, port=self.port or default_port
         )
@@ -396,11 +421,12 @@ class Response:
         )
         self.extensions = {} if extensions is None else extensions
 
+        self._content: Optional[bytes] = None
         self._stream_consumed = False
 
     @property
     def content(self) -> bytes:
-        if not hasattr(self, "_content"):
+        if self._content is None:
             if isinstance(self.stream, Iterable):
                 raise RuntimeError(
                     "Attempted to access 'response.content' on a streaming response. "
@@ -424,7 +450,7 @@ class Response:
                 "Attempted to read an asynchronous response using 'response.read()'. "
                 "You should use 'await response.aread()' instead."
             )
-        if not hasattr(self, "_content"):
+        if self._content is None:
             self._content = b"".join([part for part in self.iter_stream()])
         return self._content
 
@@ -461,7 +487,7 @@ class Response:
                 "'await response.aread()'. "
                 "You should use 'response.read()' instead."
             )
-        if not hasattr(self, "_content"):
+        if self._content is None:
             self._content = b"".join([part async for part in self.aiter_stream()])
         return self._content
 
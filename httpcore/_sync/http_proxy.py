@@ -1,6 +1,7 @@
 import logging
 import ssl
 from base64 import b64encode
+from functools import lru_cache
 from typing import Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from .._backends.base import SOCKET_OPTION, NetworkBackend
@@ -37,22 +38,42 @@ def merge_headers(
     Append default_headers and override_headers, de-duplicating if a key exists
     in both cases.
     """
-    default_headers = [] if default_headers is None else list(default_headers)
-    override_headers = [] if override_headers is None else list(override_headers)
-    has_override = set(key.lower() for key, value in override_headers)
-    default_headers = [
+    if not default_headers:
+        return [] if override_headers is None else list(override_headers)
+    if not override_headers:
+        return list(default_headers)
+
+    has_override = {key.lower() for key, value in override_headers}
+    merged = [
         (key, value)
         for key, value in default_headers
         if key.lower() not in has_override
     ]
-    return default_headers + override_headers
+    merged.extend(override_headers)
+    return merged
 
 
 def build_auth_header(username: bytes, password: bytes) -> bytes:
-    userpass = username + b":" + password
+    userpass = b":".join((username, password))
     return b"Basic " + b64encode(userpass)
 
 
+@lru_cache(maxsize=None)
+def tunnel_ssl_context(http2: bool) -> ssl.SSLContext:
+    """
+    Return the default SSL context used for tunnelled connections.
+
+    Loading the certificate bundle is expensive, so we build at most two of
+    these, one for each ALPN configuration, and share them between tunnels.
+    Tunnels never modify a shared context, so HTTP/1.1-only and HTTP/2
+    tunnels cannot interfere with each other's ALPN settings.
+    """
+    ssl_context = default_ssl_context()
+    alpn_protocols = ["http/1.1", "h2"] if http2 else ["http/1.1"]
+    ssl_context.set_alpn_protocols(alpn_protocols)
+    return ssl_context
+
+
 class HTTPProxy(ConnectionPool):
     """
     A connection pool that sends requests via an HTTP proxy.
@@ -140,9 +161,7 @@ class HTTPProxy(ConnectionPool):
             username = enforce_bytes(proxy_auth[0], name="proxy_auth")
             password = enforce_bytes(proxy_auth[1], name="proxy_auth")
             authorization = build_auth_header(username, password)
-            self._proxy_headers = [
-                (b"Proxy-Authorization", authorization)
-            ] + self._proxy_headers
+            self._proxy_headers.insert(0, (b"Proxy-Authorization", authorization))
 
     def create_connection(self, origin: Origin) -> ConnectionInterface:
         if origin.scheme == b"http":
@@ -168,6 +187,13 @@ class HTTPProxy(ConnectionPool):
 
 
 class ForwardHTTPConnection(ConnectionInterface):
+    __slots__ = (
+        "_connection",
+        "_proxy_origin",
+        "_proxy_headers",
+        "_remote_origin",
+    )
+
     def __init__(
         self,
         proxy_origin: Origin,
@@ -232,6 +258,22 @@ class ForwardHTTPConnection(ConnectionInterface):
 
 
 class TunnelHTTPConnection(ConnectionInterface):
+    __slots__ = (
+        "_connection",
+        "_proxy_origin",
+        "_remote_origin",
+        "_ssl_context",
+        "_proxy_ssl_context",
+        "_proxy_headers",
+        "_keepalive_expiry",
+        "_http1",
+        "_http2",
+        "_connect_lock",
+        "_connected",
+        "_connect_target",
+        "_server_hostname",
+    )
+
     def __init__(
         self,
         proxy_origin: Origin,
@@ -263,85 +305,92 @@ class TunnelHTTPConnection(ConnectionInterface):
         self._connect_lock = Lock()
         self._connected = False
 
+        # Pre-compute values for the CONNECT request and TLS upgrade, so that
+        # we do as little work as possible while holding the connect lock.
+        self._connect_target = b"%b:%d" % (remote_origin.host, remote_origin.port)
+        self._server_hostname = remote_origin.host.decode("ascii")
+
     def handle_request(self, request: Request) -> Response:
+        # Once the tunnel is established we no longer need to take the lock,
+        # so only acquire it while we are still unconnected.
+        if not self._connected:
+            with self._connect_lock:
+                if not self._connected:
+                    self._connect(request)
+        return self._connection.handle_request(request)
+
+    def _connect(self, request: Request) -> None:
         timeouts = request.extensions.get("timeout", {})
         timeout = timeouts.get("connect", None)
 
-        with self._connect_lock:
-            if not self._connected:
-                target = b"%b:%d" % (self._remote_origin.host, self._remote_origin.port)
-
-                connect_url = URL(
-                    scheme=self._proxy_origin.scheme,
-                    host=self._proxy_origin.host,
-                    port=self._proxy_origin.port,
-                    target=target,
-                )
-                connect_headers = merge_headers(
-                    [(b"Host", target), (b"Accept", b"*/*")], self._proxy_headers
-                )
-                connect_request = Request(
-                    method=b"CONNECT",
-                    url=connect_url,
-                    headers=connect_headers,
-                    extensions=request.extensions,
-                )
-                connect_response = self._connection.handle_request(
-                    connect_request
-                )
-
-                if connect_response.status < 200 or connect_response.status > 299:
-                    reason_bytes = connect_response.extensions.get("reason_phrase", b"")
-                    reason_str = reason_bytes.decode("ascii", errors="ignore")
-                    msg = "%d %s" % (connect_response.status, reason_str)
-                    self._connection.close()
-                    raise ProxyError(msg)
-
-                stream = connect_response.extensions["network_stream"]
-
-                # Upgrade the stream to SSL
-                ssl_context = (
-                    default_ssl_context()
-                    if self._ssl_context is None
-                    else self._ssl_context
-                )
-                alpn_protocols = ["http/1.1", "h2"] if self._http2 else ["http/1.1"]
-                ssl_context.set_alpn_protocols(alpn_protocols)
-
-                kwargs = {
-                    "ssl_context": ssl_context,
-                    "server_hostname": self._remote_origin.host.decode("ascii"),
-                    "timeout": timeout,
-                }
-                with Trace("start_tls", logger, request, kwargs) as trace:
-                    stream = stream.start_tls(**kwargs)
-                    trace.return_value = stream
-
-                # Determine if we should be using HTTP/1.1 or HTTP/2
-                ssl_object = stream.get_extra_info("ssl_object")
-                http2_negotiated = (
-                    ssl_object is not None
-                    and ssl_object.selected_alpn_protocol() == "h2"
-                )
-
-                # Create the HTTP/1.1 or HTTP/2 connection
-                if http2_negotiated or (self._http2 and not self._http1):
-                    from .http2 import HTTP2Connection
-
-                    self._connection = HTTP2Connection(
-                        origin=self._remote_origin,
-                        stream=stream,
-                        keepalive_expiry=self._keepalive_expiry,
-                    )
-                else:
-                    self._connection = HTTP11Connection(
-                        origin=self._remote_origin,
-                        stream=stream,
-                        keepalive_expiry=self._keepalive_expiry,
-                    )
-
-                self._connected = True
-        return self._connection.handle_request(request)
+        connect_url = URL(
+            scheme=self._proxy_origin.scheme,
+            host=self._proxy_origin.host,
+            port=self._proxy_origin.port,
+            target=self._connect_target,
+        )
+        connect_headers = merge_headers(
+            [(b"Host", self._connect_target), (b"Accept", b"*/*")], self._proxy_headers
+        )
+        connect_request = Request(
+            method=b"CONNECT",
+            url=connect_url,
+            headers=connect_headers,
+            extensions=request.extensions,
+        )
+        connect_response = self._connection.handle_request(connect_request)
+
+        if connect_response.status < 200 or connect_response.status > 299:
+            reason_bytes = connect_response.extensions.get("reason_phrase", b"")
+            reason_str = reason_bytes.decode("ascii", errors="ignore")
+            msg = "%d %s" % (connect_response.status, reason_str)
+            self._connection.close()
+            raise ProxyError(msg)
+
+        stream = connect_response.extensions["network_stream"]
+
+        # Upgrade the stream to SSL
+        if self._ssl_context is None:
+            ssl_context = tunnel_ssl_context(self._http2)
+        else:
+            ssl_context = self._ssl_context
+            alpn_protocols = ["http/1.1", "h2"] if self._http2 else ["http/1.1"]
+            ssl_context.set_alpn_protocols(alpn_protocols)
+
+        kwargs = {
+            "ssl_context": ssl_context,
+            "server_hostname": self._server_hostname,
+            "timeout": timeout,
+        }
+        with Trace("start_tls", logger, request, kwargs) as trace:
+            stream = stream.start_tls(**kwargs)
+            trace.return_value = stream
+
+        # Determine if we should be using HTTP/1.1 or HTTP/2
+        ssl_object = stream.get_extra_info("ssl_object")
+        http2_negotiated = (
+            ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2"
+        )
+
+        # Create the HTTP/1.1 or HTTP/2 connection
+        if http2_negotiated or (self._http2 and not self._http1):
+            from .http2 import HTTP2Connection
+
+            self._connection = HTTP2Connection(
+                origin=self._remote_origin,
+                stream=stream,
+                keepalive_expiry=self._keepalive_expiry,
+            )
+        else:
+            self._connection = HTTP11Connection(
+                origin=self._remote_origin,
+                stream=stream,
+                keepalive_expiry=self._keepalive_expiry,
+            )
+
+        # Only mark the tunnel as connected once the connection is fully
+        # established, since other requests check this flag without the lock.
+        self._connected = True
 
     def can_handle_request(self, origin: Origin) -> bool:
         return origin == self._remote_origin
@@ -1,5 +1,5 @@
-from contextlib import contextmanager
-from typing import Iterator, Optional, Union
+from types import TracebackType
+from typing import Iterator, Optional, Type, Union
 
 from .._models import (
     URL,
@@ -8,14 +8,13 @@ from .._models import (
     Origin,
     Request,
     Response,
-    enforce_bytes,
-    enforce_headers,
-    enforce_url,
     include_request_headers,
 )
 
 
 class RequestInterface:
+    __slots__ = ()
+
     def request(
         self,
         method: Union[bytes, str],
@@ -25,14 +24,7 @@ class RequestInterface:
         content: Union[bytes, Iterator[bytes], None] = None,
         extensions: Optional[Extensions] = None,
     ) -> Response:
-        # Strict type checking on our parameters.
-        method = enforce_bytes(method, name="method")
-        url = enforce_url(url, name="url")
-        headers = enforce_headers(headers, name="headers")
-
-        # Include Host header, and optionally Content-Length or Transfer-Encoding.
-        headers = include_request_headers(headers, url=url, content=content)
-
+        # Strict type checking on our parameters is performed by `Request`.
         request = Request(
             method=method,
             url=url,
@@ -40,6 +32,11 @@ class RequestInterface:
             content=content,
             extensions=extensions,
         )
+
+        # Include Host header, and optionally Content-Length or Transfer-Encoding.
+        request.headers = include_request_headers(
+            request.headers, url=request.url, content=content
+        )
         response = self.handle_request(request)
         try:
             response.read()
@@ -47,7 +44,6 @@ class RequestInterface:
             response.close()
         return response
 
-    @contextmanager
     def stream(
         self,
         method: Union[bytes, str],
@@ -56,15 +52,8 @@ class RequestInterface:
         headers: HeaderTypes = None,
         content: Union[bytes, Iterator[bytes], None] = None,
         extensions: Optional[Extensions] = None,
-    ) -> Iterator[Response]:
-        # Strict type checking on our parameters.
-        method = enforce_bytes(method, name="method")
-        url = enforce_url(url, name="url")
-        headers = enforce_headers(headers, name="headers")
-
-        # Include Host header, and optionally Content-Length or Transfer-Encoding.
-        headers = include_request_headers(headers, url=url, content=content)
-
+    ) -> "StreamContextManager":
+        # Strict type checking on our parameters is performed by `Request`.
         request = Request(
             method=method,
             url=url,
@@ -72,17 +61,50 @@ class RequestInterface:
             content=content,
             extensions=extensions,
         )
-        response = self.handle_request(request)
-        try:
-            yield response
-        finally:
-            response.close()
+
+        # Include Host header, and optionally Content-Length or Transfer-Encoding.
+        request.headers = include_request_headers(
+            request.headers, url=request.url, content=content
+        )
+        return StreamContextManager(self, request)
 
     def handle_request(self, request: Request) -> Response:
         raise NotImplementedError()  # pragma: nocover
 
 
+class StreamContextManager:
+    """
+    The context manager returned by `.stream()`.
+
+    Sends the request on entering the block, and closes the response on
+    leaving it. We use a plain class rather than a generator-based context
+    manager here, since this is on the hot path for every streaming request.
+    """
+
+    __slots__ = ("_interface", "_request", "_response")
+
+    def __init__(self, interface: RequestInterface, request: Request) -> None:
+        self._interface = interface
+        self._request = request
+        self._response: Optional[Response] = None
+
+    def __enter__(self) -> Response:
+        self._response = self._interface.handle_request(self._request)
+        return self._response
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        assert self._response is not None
+        self._response.close()
+
+
 class ConnectionInterface(RequestInterface):
+    __slots__ = ()
+
     def close(self) -> None:
         raise NotImplementedError()  # pragma: nocover
 
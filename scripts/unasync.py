@@ -17,7 +17,6 @@ SUBS = [
     ('aclose', 'close'),
     ('aiter_stream', 'iter_stream'),
     ('aread', 'read'),
-    ('asynccontextmanager', 'contextmanager'),
     ('__aenter__', '__enter__'),
     ('__aexit__', '__exit__'),
     ('__aiter__', '__iter__'),